@@ -0,0 +1,69 @@
+"""
+Compile the .env file into an importable Python module.
+
+python-dotenv tokenizes .env on every process start. This script parses it
+once and writes the values to _env_cache.py as a plain dict literal, so later
+runs only evaluate that literal.
+
+Run it after editing .env, or let load_env() regenerate the cache whenever
+.env is newer than _env_cache.py.
+"""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+ENV_FILE = BASE_DIR / ".env"
+CACHE_FILE = BASE_DIR / "_env_cache.py"
+
+CACHE_HEADER = '"""Generated from .env by env_compile.py. Do not edit or commit."""\n'
+
+
+def compile_env(env_file: Path = ENV_FILE, cache_file: Path = CACHE_FILE) -> dict:
+    """Parse the .env file and write its values to the cache module."""
+    from dotenv import dotenv_values
+
+    values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+
+    # Write to a temp file first so a crash never leaves a half-written module.
+    # mkstemp creates it 0600, so the secrets are never world-readable, even
+    # if a crash leaves the temp file behind
+    fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, prefix=f"{cache_file.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(f"{CACHE_HEADER}ENV = {values!r}\n")
+        # The cache holds the same secrets, so keep .env's permissions
+        os.chmod(tmp_name, stat.S_IMODE(env_file.stat().st_mode))
+        os.replace(tmp_name, cache_file)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return values
+
+
+def load_env() -> None:
+    """
+    Load .env values into os.environ through the compiled cache.
+    
+    Like load_dotenv(), variables already set in the environment win.
+    """
+    if not ENV_FILE.exists():
+        return
+
+    if not CACHE_FILE.exists() or CACHE_FILE.stat().st_mtime < ENV_FILE.stat().st_mtime:
+        compile_env()
+
+    # Executed from source rather than imported: the .pyc check compares
+    # whole-second mtimes and size, so a same-length value rewritten within
+    # a second of the last compile would otherwise be served stale
+    namespace = {}
+    exec(compile(CACHE_FILE.read_bytes(), str(CACHE_FILE), "exec"), namespace)
+    for key, value in namespace["ENV"].items():
+        os.environ.setdefault(key, value)
+
+
+if __name__ == "__main__":
+    env = compile_env()
+    print(f"✅ Compiled {len(env)} variables from {ENV_FILE.name} into {CACHE_FILE.name}")
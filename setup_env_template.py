@@ -4,6 +4,8 @@ Run this script to create a .env file template that you can customize.
 """
 
 import os
+import sys
+import tempfile
 
 ENV_TEMPLATE = """# ============================================
 # European League Table Scraper Configuration
@@ -91,17 +93,24 @@ SPORTS_BASE_URL=https://www.your-sports-website.com
 # 6. Use SELECTED_LEAGUES to scrape only specific leagues
 """
 
-def create_env_file():
-    """Create a .env file from the template."""
-    if os.path.exists('.env'):
+def create_env_file(force=False):
+    """
+    Create a .env file from the template.
+    
+    Args:
+        force: Overwrite an existing .env without prompting (for automation)
+    """
+    if os.path.exists('.env') and not force:
         print("⚠️  Warning: .env file already exists!")
         response = input("Do you want to overwrite it? (yes/no): ")
         if response.lower() not in ['yes', 'y']:
             print("Aborted. Existing .env file preserved.")
             return
     
-    with open('.env', 'w') as f:
+    # Write to a temp file and rename it into place so .env is never half-written
+    with tempfile.NamedTemporaryFile('w', dir='.', prefix='.env.', suffix='.tmp', delete=False) as f:
         f.write(ENV_TEMPLATE)
+    os.replace(f.name, '.env')
     
     print("✅ Created .env file successfully!")
     print("\n📝 Next steps:")
@@ -111,5 +120,5 @@ def create_env_file():
     print("\n💡 The proxy is already configured for WebShare.io")
 
 if __name__ == "__main__":
-    create_env_file()
+    create_env_file(force="--force" in sys.argv[1:])
 
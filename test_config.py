@@ -1,7 +1,8 @@
 """
 Test the configuration and verify proxy setup.
 """
-from dotenv import load_dotenv
+from env_compile import load_env
+import functools
 import os
 import sys
 
@@ -17,25 +18,47 @@ if sys.platform == 'win32':
         pass
 
 # Load environment variables
-load_dotenv()
+load_env()
+
+# Snapshot the environment once; every lookup below reads this plain dict
+_ENV = dict(os.environ)
+
+
+@functools.cache
+def _league_url_keys():
+    """Env var names for every league's URL, derived once per process."""
+    # Imported here so loading this module stays cheap
+    from web_scrapping import EUROPEAN_LEAGUES, get_league_env_var_name
+    return tuple(get_league_env_var_name(league_key) for league_key in EUROPEAN_LEAGUES)
+
 
 def test_config():
     """Test if required configuration is present."""
-    print("=" * 60)
-    print("Configuration Test")
-    print("=" * 60)
+    # Collect the report and emit it in one write instead of a print per line
+    lines = []
+    try:
+        return _check_config(lines.append)
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _check_config(report):
+    """Run the configuration checks, passing each report line to `report`."""
+    report("=" * 60)
+    report("Configuration Test")
+    report("=" * 60)
     
     # Test OpenAI API Key
-    api_key = os.environ.get("OPENAI_API_KEY")
+    api_key = _ENV.get("OPENAI_API_KEY")
     if api_key:
         masked_key = api_key[:20] + "..." if len(api_key) > 20 else api_key
-        print(f"✅ OPENAI_API_KEY: {masked_key}")
+        report(f"✅ OPENAI_API_KEY: {masked_key}")
     else:
-        print("❌ OPENAI_API_KEY: Not set!")
+        report("❌ OPENAI_API_KEY: Not set!")
         return False
     
     # Test Proxy URL
-    proxy_url = os.environ.get("PROXY_URL")
+    proxy_url = _ENV.get("PROXY_URL")
     if proxy_url:
         # Mask sensitive parts
         if "@" in proxy_url:
@@ -48,62 +71,57 @@ def test_config():
                 masked_url = proxy_url
         else:
             masked_url = proxy_url
-        print(f"✅ PROXY_URL: {masked_url}")
+        report(f"✅ PROXY_URL: {masked_url}")
     else:
-        print("⚠️  PROXY_URL: Not set (optional but recommended)")
+        report("⚠️  PROXY_URL: Not set (optional but recommended)")
     
     # Test League Filtering
-    league_tier = os.environ.get("LEAGUE_TIER", "1")
-    print(f"📊 LEAGUE_TIER: {league_tier}")
+    league_tier = _ENV.get("LEAGUE_TIER", "1")
+    report(f"📊 LEAGUE_TIER: {league_tier}")
     
-    selected_leagues = os.environ.get("SELECTED_LEAGUES", "")
+    selected_leagues = _ENV.get("SELECTED_LEAGUES", "")
     if selected_leagues:
-        print(f"📋 SELECTED_LEAGUES: {selected_leagues}")
+        report(f"📋 SELECTED_LEAGUES: {selected_leagues}")
     else:
-        print("📋 SELECTED_LEAGUES: Not set (will scrape all leagues in tier)")
+        report("📋 SELECTED_LEAGUES: Not set (will scrape all leagues in tier)")
     
     # Test Base URL
-    base_url = os.environ.get("SPORTS_BASE_URL", "")
+    base_url = _ENV.get("SPORTS_BASE_URL", "")
     if base_url:
-        print(f"🌐 SPORTS_BASE_URL: {base_url}")
+        report(f"🌐 SPORTS_BASE_URL: {base_url}")
     else:
-        print("⚠️  SPORTS_BASE_URL: Not set")
-        print("   Individual league URLs must be set instead")
+        report("⚠️  SPORTS_BASE_URL: Not set")
+        report("   Individual league URLs must be set instead")
     
     # Count configured league URLs
-    from web_scrapping import EUROPEAN_LEAGUES
-    configured_count = 0
-    for league_key in EUROPEAN_LEAGUES.keys():
-        env_var = league_key.upper().replace(" ", "_").replace(".", "").replace("-", "_")
-        if os.environ.get(f"{env_var}_URL"):
-            configured_count += 1
+    from web_scrapping import EUROPEAN_LEAGUES, leagues_by_tier
+    if base_url:
+        # The base URL covers every league; individual URLs are not consulted
+        configured_count = 0
+    else:
+        configured_count = sum(1 for env_var in _league_url_keys() if _ENV.get(env_var))
     
     if base_url or configured_count > 0:
         if base_url:
-            print(f"📊 Using SPORTS_BASE_URL pattern for all {len(EUROPEAN_LEAGUES)} leagues")
+            report(f"📊 Using SPORTS_BASE_URL pattern for all {len(EUROPEAN_LEAGUES)} leagues")
         else:
-            print(f"📊 Configured individual URLs for {configured_count} leagues")
+            report(f"📊 Configured individual URLs for {configured_count} leagues")
     else:
-        print("❌ No league URLs configured!")
-        print("   Set SPORTS_BASE_URL or individual league URLs in .env file")
+        report("❌ No league URLs configured!")
+        report("   Set SPORTS_BASE_URL or individual league URLs in .env file")
         return False
     
-    print("=" * 60)
-    print("✅ Configuration looks good!")
-    print("=" * 60)
-    print("\nAvailable leagues:")
-    print(f"  Total: {len(EUROPEAN_LEAGUES)}")
+    report("=" * 60)
+    report("✅ Configuration looks good!")
+    report("=" * 60)
+    report("\nAvailable leagues:")
+    report(f"  Total: {len(EUROPEAN_LEAGUES)}")
     
     # Group by tier
-    tiers = {}
-    for league_key, league_info in EUROPEAN_LEAGUES.items():
-        tier = league_info.get("tier", 1)
-        if tier not in tiers:
-            tiers[tier] = []
-        tiers[tier].append(league_key)
+    tiers = leagues_by_tier()
     
     for tier in sorted(tiers.keys()):
-        print(f"  Tier {tier}: {len(tiers[tier])}")
+        report(f"  Tier {tier}: {len(tiers[tier])}")
     
     return True
 